@@ -0,0 +1,35 @@
+"""add_ownership_indexes
+
+Revision ID: 3136d1059ac7
+Revises: 2316edc4b785
+Create Date: 2026-10-15 10:12:41.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3136d1059ac7'
+down_revision: Union[str, Sequence[str], None] = '2316edc4b785'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CREATE INDEX CONCURRENTLY нельзя выполнять внутри транзакции
+    with op.get_context().autocommit_block():
+        op.create_index('ix_flashcards_user_group', 'flashcards', ['user_id', 'group_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_flashcards_group_id'), 'flashcards', ['group_id'], unique=False, postgresql_concurrently=True)
+        op.create_index(op.f('ix_groups_user_id'), 'groups', ['user_id'], unique=False, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(op.f('ix_groups_user_id'), table_name='groups', postgresql_concurrently=True)
+        op.drop_index(op.f('ix_flashcards_group_id'), table_name='flashcards', postgresql_concurrently=True)
+        op.drop_index('ix_flashcards_user_group', table_name='flashcards', postgresql_concurrently=True)
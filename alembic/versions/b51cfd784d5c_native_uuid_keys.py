@@ -0,0 +1,66 @@
+"""native_uuid_keys
+
+Revision ID: b51cfd784d5c
+Revises: bbcedb55e030
+Create Date: 2026-10-15 11:04:52.913467
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b51cfd784d5c'
+down_revision: Union[str, Sequence[str], None] = 'bbcedb55e030'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (таблица, колонка) в порядке: сначала ссылающиеся, потом первичные ключи
+COLUMNS = [
+    ('flashcards', 'group_id'),
+    ('flashcards', 'user_id'),
+    ('groups', 'user_id'),
+    ('flashcards', 'id'),
+    ('groups', 'id'),
+    ('users', 'id'),
+]
+
+
+def _drop_foreign_keys() -> None:
+    op.drop_constraint('flashcards_group_id_fkey', 'flashcards', type_='foreignkey')
+    op.drop_constraint('flashcards_user_id_fkey', 'flashcards', type_='foreignkey')
+    op.drop_constraint('groups_user_id_fkey', 'groups', type_='foreignkey')
+
+
+def _create_foreign_keys() -> None:
+    op.create_foreign_key('groups_user_id_fkey', 'groups', 'users', ['user_id'], ['id'])
+    op.create_foreign_key('flashcards_user_id_fkey', 'flashcards', 'users', ['user_id'], ['id'])
+    op.create_foreign_key('flashcards_group_id_fkey', 'flashcards', 'groups', ['group_id'], ['id'], ondelete='CASCADE')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # типы связанных колонок должны совпадать, поэтому FK пересоздаём
+    _drop_foreign_keys()
+    for table, column in COLUMNS:
+        op.alter_column(table, column,
+               existing_type=sa.String(),
+               type_=postgresql.UUID(as_uuid=True),
+               postgresql_using=f'{column}::uuid',
+               existing_nullable=False)
+    _create_foreign_keys()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _drop_foreign_keys()
+    for table, column in COLUMNS:
+        op.alter_column(table, column,
+               existing_type=postgresql.UUID(as_uuid=True),
+               type_=sa.String(),
+               postgresql_using=f'{column}::text',
+               existing_nullable=False)
+    _create_foreign_keys()
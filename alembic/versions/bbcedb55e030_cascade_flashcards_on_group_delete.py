@@ -0,0 +1,30 @@
+"""cascade_flashcards_on_group_delete
+
+Revision ID: bbcedb55e030
+Revises: 3136d1059ac7
+Create Date: 2026-10-15 10:31:07.552190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bbcedb55e030'
+down_revision: Union[str, Sequence[str], None] = '3136d1059ac7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_constraint('flashcards_group_id_fkey', 'flashcards', type_='foreignkey')
+    op.create_foreign_key('flashcards_group_id_fkey', 'flashcards', 'groups', ['group_id'], ['id'], ondelete='CASCADE')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('flashcards_group_id_fkey', 'flashcards', type_='foreignkey')
+    op.create_foreign_key('flashcards_group_id_fkey', 'flashcards', 'groups', ['group_id'], ['id'])
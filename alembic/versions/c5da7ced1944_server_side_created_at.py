@@ -0,0 +1,39 @@
+"""server_side_created_at
+
+Revision ID: c5da7ced1944
+Revises: b51cfd784d5c
+Create Date: 2026-10-15 12:20:36.104582
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5da7ced1944'
+down_revision: Union[str, Sequence[str], None] = 'b51cfd784d5c'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('users', 'groups')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        op.execute(f'UPDATE {table} SET created_at = now() WHERE created_at IS NULL')
+        op.alter_column(table, 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=sa.text('now()'),
+               nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        op.alter_column(table, 'created_at',
+               existing_type=sa.DateTime(timezone=True),
+               server_default=None,
+               nullable=True)
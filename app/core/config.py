@@ -7,9 +7,39 @@ class Settings:
     SECRET_KEY = os.getenv("SECRET_KEY", "super_secret_key_123")
     ALGORITHM = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES = 60
+    # ~250 мс на verify на целевом железе; пересчитать при смене окружения
+    BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    # лимит на тело любого запроса, включая загружаемый файл с multipart-обёрткой
+    MAX_REQUEST_BYTES = int(os.getenv("MAX_REQUEST_BYTES", str(20 * 1024 * 1024)))
+    UPLOAD_CHUNK_SIZE = int(os.getenv("UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+    LOGIN_RATE_LIMIT = os.getenv("LOGIN_RATE_LIMIT", "10/minute")
+    RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", "memory://")
+    JWT_CACHE_TTL = int(os.getenv("JWT_CACHE_TTL", "5"))
+    JWT_CACHE_MAXSIZE = int(os.getenv("JWT_CACHE_MAXSIZE", "10000"))
+    # общий для всех воркеров кэш проверенных токенов; без REDIS_URL — только локальный
+    REDIS_URL = os.getenv("REDIS_URL")
+    # кэш — не источник истины: при медленном Redis быстрее проверить токен заново
+    REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", "0.1"))
+    REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
     DATABASE_URL = os.getenv(
         "DATABASE_URL",
         "postgresql+asyncpg://postgres:postgres@db:5432/smartcards"
     )
+    # Общий лимит соединений на все воркеры (см. gunicorn.conf.py); пул делится поровну
+    DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "80"))
+    WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+    _DB_CONNECTIONS_PER_WORKER = DB_MAX_CONNECTIONS // WEB_CONCURRENCY
+    if _DB_CONNECTIONS_PER_WORKER < 2:
+        raise RuntimeError(
+            f"DB_MAX_CONNECTIONS={DB_MAX_CONNECTIONS} is too small for "
+            f"{WEB_CONCURRENCY} workers (at least 2 connections per worker)"
+        )
+    DB_POOL_SIZE = int(
+        os.getenv("DB_POOL_SIZE", min(20, _DB_CONNECTIONS_PER_WORKER * 2 // 3))
+    )
+    DB_MAX_OVERFLOW = int(
+        os.getenv("DB_MAX_OVERFLOW", min(10, _DB_CONNECTIONS_PER_WORKER - DB_POOL_SIZE))
+    )
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
 
 settings = Settings()
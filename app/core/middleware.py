@@ -0,0 +1,42 @@
+from fastapi import HTTPException
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class BodySizeLimitMiddleware:
+    # Ограничение срабатывает до того, как Starlette разберёт multipart и сбросит
+    # тело во временный файл: по Content-Length — сразу, иначе — по мере чтения потока
+    def __init__(self, app: ASGIApp, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_length = Headers(scope=scope).get("content-length")
+        if content_length is not None and content_length.isdigit():
+            if int(content_length) > self.max_bytes:
+                response = ORJSONResponse(
+                    {"detail": "Request body too large"}, status_code=413
+                )
+                await response(scope, receive, send)
+                return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    # тело читается внутри обработчика — 413 отдаст ExceptionMiddleware
+                    raise HTTPException(
+                        status_code=413, detail="Request body too large"
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -0,0 +1,9 @@
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.core.config import settings
+
+# memory:// считает лимиты в каждом воркере отдельно; для общего счётчика — redis://
+limiter = Limiter(
+    key_func=get_remote_address, storage_uri=settings.RATE_LIMIT_STORAGE_URI
+)
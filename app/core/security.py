@@ -1,49 +1,224 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import math
+import time
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from uuid import UUID
 
-from fastapi import Depends, HTTPException
+import bcrypt
+import jwt
+import orjson
+from cachetools import TTLCache
+from fastapi import Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
+from jwt.utils import base64url_decode, base64url_encode
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
+from sqlalchemy import bindparam, select
 
 from app.core.config import settings
 from app.core.database import get_db
 from app.models.user import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+# sha256(token) -> (user, момент истечения записи); запись живёт не дольше exp токена
+_token_cache = TTLCache(maxsize=settings.JWT_CACHE_MAXSIZE, ttl=settings.JWT_CACHE_TTL)
+# sha256(token) -> future идущей проверки этого токена
+_pending_tokens: dict[bytes, asyncio.Future] = {}
 
-def verify_password(plain: str, hashed: str) -> bool:
-    return pwd_context.verify(plain, hashed)
+_REDIS_KEY_PREFIX = b"jwt:"
+
+_SELECT_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_SELECT_USER_ID_BY_EMAIL = select(User.id).where(User.email == bindparam("email")).limit(1)
+
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+# заголовок у всех токенов одинаковый — кодируем его один раз
+_JWT_HEADER_SEGMENT = base64url_encode(
+    json.dumps({"alg": settings.ALGORITHM, "typ": "JWT"}, separators=(",", ":")).encode()
+)
+
+def _sign(signing_input: bytes) -> bytes:
+    return hmac.new(
+        settings.SECRET_KEY.encode(), signing_input, _HMAC_DIGESTS[settings.ALGORITHM]
+    ).digest()
+
+def _hash_password(password: str) -> str:
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
+    return bcrypt.hashpw(password.encode(), salt).decode()
+
+def _verify_password(plain: str, hashed: str) -> bool:
+    try:
+        return bcrypt.checkpw(plain.encode(), hashed.encode())
+    except ValueError:
+        return False
+
+# bcrypt считается сотни миллисекунд — уводим его с event loop в пул потоков
+async def hash_password(password: str) -> str:
+    return await asyncio.to_thread(_hash_password, password)
+
+async def verify_password(plain: str, hashed: str) -> bool:
+    return await asyncio.to_thread(_verify_password, plain, hashed)
+
+# сверяемся с ним, когда пользователя нет, чтобы время ответа не выдавало email
+DUMMY_PASSWORD_HASH = _hash_password("dummy-password")
+
+def needs_rehash(hashed: str) -> bool:
+    # хэши вида $2b$12$... — пересчитываем, если cost отличается от настроек
+    try:
+        return int(hashed.split("$")[2]) != settings.BCRYPT_ROUNDS
+    except (IndexError, ValueError):
+        return True
 
 def create_access_token(data: dict, expires_delta: timedelta | None = None):
-    to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=15))
-    to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    payload = json.dumps({**data, "exp": int(expire.timestamp())}, separators=(",", ":"))
+    signing_input = _JWT_HEADER_SEGMENT + b"." + base64url_encode(payload.encode())
+    return (signing_input + b"." + base64url_encode(_sign(signing_input))).decode()
 
 async def get_user_by_email(email: str, db: AsyncSession):
-    result = await db.execute(select(User).where(User.email == email))
-    return result.scalars().first()
+    result = await db.execute(_SELECT_USER_BY_EMAIL, {"email": email})
+    return result.scalar_one_or_none()
+
+async def check_user_exists(email: str, db: AsyncSession) -> bool:
+    # тянем только PK, без гидрации ORM-объекта
+    user_id = await db.scalar(_SELECT_USER_ID_BY_EMAIL, {"email": email})
+    return user_id is not None
+
+@lru_cache(maxsize=2048)
+def _decode_segments(token: str) -> tuple[dict, dict, bytes, bytes]:
+    # кэшируется только разбор base64/JSON; подпись и exp проверяются при каждом вызове,
+    # поэтому возвращаемые словари общие и их нельзя изменять
+    try:
+        header_b64, payload_b64, signature_b64 = token.encode().split(b".")
+        header = json.loads(base64url_decode(header_b64))
+        payload = json.loads(base64url_decode(payload_b64))
+        signature = base64url_decode(signature_b64)
+    except ValueError as exc:
+        raise jwt.DecodeError("Invalid token segments") from exc
+    if not isinstance(header, dict) or not isinstance(payload, dict):
+        raise jwt.DecodeError("Invalid token segments")
+    return header, payload, header_b64 + b"." + payload_b64, signature
+
+def decode_access_token(token: str) -> dict:
+    header, payload, signing_input, signature = _decode_segments(token)
+    if header.get("alg") != settings.ALGORITHM:
+        raise jwt.InvalidAlgorithmError("Unexpected token algorithm")
+    if not hmac.compare_digest(_sign(signing_input), signature):
+        raise jwt.InvalidSignatureError("Signature verification failed")
+    exp = payload.get("exp")
+    if not isinstance(exp, (int, float)) or exp <= time.time():
+        raise jwt.ExpiredSignatureError("Signature has expired")
+    # копия: закэшированный словарь общий для всех запросов с этим токеном
+    return dict(payload)
 
-async def get_current_user(token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)):
+async def _load_shared_user(redis: Redis, key: bytes) -> tuple[User, float] | None:
+    try:
+        raw = await redis.get(_REDIS_KEY_PREFIX + key)
+    except RedisError:
+        return None
+    if raw is None:
+        return None
+    try:
+        data = orjson.loads(raw)
+        expires_at = float(data["expires_at"])
+        # объект не привязан к сессии; обработчикам нужны только поля пользователя
+        user = User(id=UUID(data["id"]), email=data["email"], full_name=data["full_name"])
+    except (orjson.JSONDecodeError, KeyError, TypeError, ValueError):
+        # битая или чужая запись — просто проверяем токен заново
+        return None
+    if time.time() >= expires_at:
+        return None
+    return user, expires_at
+
+async def _store_shared_user(redis: Redis, key: bytes, user: User, expires_at: float):
+    data = {
+        "id": user.id,
+        "email": user.email,
+        "full_name": user.full_name,
+        "expires_at": expires_at,
+    }
+    try:
+        await redis.set(
+            _REDIS_KEY_PREFIX + key,
+            orjson.dumps(data),
+            ex=max(1, math.ceil(expires_at - time.time())),
+        )
+    except RedisError:
+        pass
+
+async def _resolve_user(token: str, key: bytes, db: AsyncSession, redis: Redis | None):
+    # промах локального кэша: Redis, затем проверка токена и запрос в БД.
+    # None — токен недействителен
+    if redis is not None:
+        shared = await _load_shared_user(redis, key)
+        if shared is not None:
+            _token_cache[key] = shared
+            return shared[0]
+    try:
+        payload = decode_access_token(token)
+    except jwt.InvalidTokenError:
+        return None
+    email = payload.get("sub")
+    if email is None:
+        return None
+    user = await get_user_by_email(email, db)
+    if user is None:
+        return None
+    expires_at = min(payload["exp"], time.time() + settings.JWT_CACHE_TTL)
+    _token_cache[key] = (user, expires_at)
+    if redis is not None:
+        await _store_shared_user(redis, key, user, expires_at)
+    return user
+
+async def get_current_user(
+    request: Request,
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db),
+):
     credentials_exception = HTTPException(
         status_code=401,
         detail="Invalid token",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        email = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    user = await get_user_by_email(email, db)
+    key = hashlib.sha256(token.encode()).digest()
+    cached = _token_cache.get(key)
+    if cached is not None:
+        user, expires_at = cached
+        if time.time() < expires_at:
+            return user
+        _token_cache.pop(key, None)
+
+    # параллельные запросы с тем же токеном ждут первую проверку, а не повторяют её
+    pending = _pending_tokens.get(key)
+    if pending is not None:
+        try:
+            user = await asyncio.shield(pending)
+        except asyncio.CancelledError:
+            if not pending.cancelled():
+                raise
+            # отменили запрос, который проверял токен, — проверяем сами
+            user = await _resolve_user(token, key, db, getattr(request.app.state, "redis", None))
+    else:
+        pending = asyncio.get_running_loop().create_future()
+        _pending_tokens[key] = pending
+        try:
+            user = await _resolve_user(token, key, db, getattr(request.app.state, "redis", None))
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as exc:
+            pending.set_exception(exc)
+            pending.exception()  # ожидающих может не быть — не логируем "never retrieved"
+            raise
+        else:
+            pending.set_result(user)
+        finally:
+            _pending_tokens.pop(key, None)
     if user is None:
         raise credentials_exception
     return user
@@ -1,4 +1,4 @@
 from uuid import uuid4
 
 def generate_uuid():
-    return str(uuid4())
+    return uuid4()
@@ -1,13 +1,46 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+from redis.asyncio import Redis
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 
+from app.core.config import settings
+from app.core.middleware import BodySizeLimitMiddleware
+from app.core.rate_limit import limiter
 from app.routers import auth, flashcards, groups
 
-app = FastAPI(title="SmartCards Backend")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.redis = None
+    if settings.REDIS_URL:
+        app.state.redis = Redis.from_url(
+            settings.REDIS_URL,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+        )
+    yield
+    if app.state.redis is not None:
+        await app.state.redis.aclose()
+
+
+app = FastAPI(
+    title="SmartCards Backend",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+app.state.limiter = limiter
+app.add_middleware(BodySizeLimitMiddleware, max_bytes=settings.MAX_REQUEST_BYTES)
+app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
 
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(groups.router, prefix="/groups", tags=["groups"])
 app.include_router(flashcards.router, prefix="/flashcards", tags=["flashcards"])
 
+# Локальный запуск с автоперезагрузкой; в продакшене — gunicorn -c gunicorn.conf.py
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
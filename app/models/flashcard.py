@@ -1,15 +1,19 @@
-from sqlalchemy import Column, String, Text, ForeignKey
+from sqlalchemy import Column, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from app.core.database import Base
 from app.core.utils import generate_uuid
 
 class Flashcard(Base):
     __tablename__ = "flashcards"
+    __table_args__ = (
+        Index("ix_flashcards_user_group", "user_id", "group_id"),
+    )
 
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=generate_uuid)
     question = Column(Text, nullable=False)
     answer = Column(Text, nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    group_id = Column(String, ForeignKey("groups.id"), nullable=False)
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
+    group_id = Column(UUID(as_uuid=True), ForeignKey("groups.id", ondelete="CASCADE"), nullable=False, index=True)
 
     group = relationship("Group", back_populates="flashcards")
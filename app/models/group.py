@@ -1,27 +1,21 @@
-from datetime import datetime, timezone
-
-from sqlalchemy import Column, DateTime, ForeignKey, String, func, select
-from sqlalchemy.orm import column_property, relationship
+from sqlalchemy import Column, DateTime, ForeignKey, String, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
 
 from app.core.database import Base
 from app.core.utils import generate_uuid
-from app.models.flashcard import Flashcard
+from app.models.flashcard import Flashcard  # noqa: F401
 
 
 class Group(Base):
     __tablename__ = "groups"
 
-    id = Column(String, primary_key=True, default=generate_uuid)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=generate_uuid)
     filename = Column(String, nullable=False)
-    user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    created_at = Column(DateTime(timezone=True), default=datetime.now(timezone.utc))
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
 
     user = relationship("User", back_populates="groups")
-    flashcards = relationship("Flashcard", back_populates="group", cascade="all, delete-orphan")
-
-    flashcards_count = column_property(
-        select(func.count(Flashcard.id))
-        .where(Flashcard.group_id == id)
-        .correlate_except(Flashcard)
-        .scalar_subquery()
+    flashcards = relationship(
+        "Flashcard", back_populates="group", cascade="all, delete-orphan", passive_deletes=True
     )
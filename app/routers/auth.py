@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import timedelta
 from app.core.database import get_db
+from app.core.rate_limit import limiter
 from app.core.security import (
+    DUMMY_PASSWORD_HASH,
+    check_user_exists,
     hash_password,
     verify_password,
     create_access_token,
     get_user_by_email,
+    needs_rehash,
 )
 from app.core.config import settings
 from app.models.user import User
@@ -18,25 +22,30 @@ router = APIRouter()
 
 @router.post("/register", response_model=UserResponse)
 async def register_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
-    existing = await get_user_by_email(user.email, db)
-    if existing:
+    if await check_user_exists(user.email, db):
         raise HTTPException(status_code=400, detail="User already exists")
     new_user = User(
         id=generate_uuid(),
         email=user.email,
-        password=hash_password(user.password),
+        password=await hash_password(user.password),
         full_name=user.full_name,
     )
     db.add(new_user)
     await db.commit()
-    await db.refresh(new_user)
     return new_user
 
 @router.post("/login", response_model=Token)
-async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
+@limiter.limit(settings.LOGIN_RATE_LIMIT)
+async def login_user(request: Request, form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_db)):
     user = await get_user_by_email(form_data.username, db)
-    if not user or not verify_password(form_data.password, user.password):
+    # bcrypt выполняется всегда, даже если пользователя нет
+    hashed = user.password if user else DUMMY_PASSWORD_HASH
+    password_ok = await verify_password(form_data.password, hashed)
+    if not user or not password_ok:
         raise HTTPException(status_code=401, detail="Invalid credentials")
+    if needs_rehash(user.password):
+        user.password = await hash_password(form_data.password)
+        await db.commit()
     access_token = create_access_token(
         {"sub": user.email},
         timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES),
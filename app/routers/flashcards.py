@@ -1,7 +1,8 @@
 from typing import List
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
@@ -14,25 +15,32 @@ from app.schemas.flashcard import (FlashcardCreate, FlashcardResponse,
 
 router = APIRouter()
 
+# Запросы собираются один раз при импорте; значения передаются через bindparam
+_OWNED_CARD = (Flashcard.id == bindparam("card_id"), Flashcard.user_id == bindparam("owner_id"))
+_SELECT_GROUP_CARDS = select(
+    Flashcard.id, Flashcard.question, Flashcard.answer, Flashcard.user_id, Flashcard.group_id
+).where(Flashcard.group_id == bindparam("group_id"), Flashcard.user_id == bindparam("owner_id"))
+_DELETE_CARD = delete(Flashcard).where(*_OWNED_CARD).returning(Flashcard.id)
+
 @router.get("/group/{group_id}", response_model=List[FlashcardResponse])
-async def get_flashcards_by_group(group_id: str, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
-    q = select(Flashcard).where(Flashcard.group_id == group_id, Flashcard.user_id == current_user.id)
-    result = await db.execute(q)
-    return result.scalars().all()
+async def get_flashcards_by_group(group_id: UUID, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    result = await db.execute(
+        _SELECT_GROUP_CARDS, {"group_id": group_id, "owner_id": current_user.id}
+    )
+    # строки из БД уже валидны — собираем ответ без повторной валидации
+    return [FlashcardResponse.model_construct(**row._mapping) for row in result]
 
 @router.post("/", response_model=FlashcardResponse)
 async def create_flashcard(
-    group_id: str,
+    group_id: UUID,
     new_card: FlashcardCreate,
     current_user=Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     # Проверяем, что группа принадлежит пользователю
-    q = select(Group).where(Group.id == group_id, Group.user_id == current_user.id)
-    res = await db.execute(q)
-    group = res.scalars().first()
+    group = await db.get(Group, group_id)
 
-    if not group:
+    if group is None or group.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Group not found or not owned by user")
 
     card = Flashcard(
@@ -45,32 +53,27 @@ async def create_flashcard(
 
     db.add(card)
     await db.commit()
-    await db.refresh(card)
     return card
 
 @router.delete("/{card_id}")
-async def delete_flashcard(card_id: str, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
-    q = select(Flashcard).where(Flashcard.id == card_id)
-    res = await db.execute(q)
-    card = res.scalars().first()
-    if not card or card.user_id != current_user.id:
+async def delete_flashcard(card_id: UUID, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    res = await db.execute(_DELETE_CARD, {"card_id": card_id, "owner_id": current_user.id})
+    if res.scalar() is None:
         raise HTTPException(status_code=404, detail="Card not found")
-    await db.execute(delete(Flashcard).where(Flashcard.id == card_id))
     await db.commit()
     return {"detail": "Card deleted"}
 
 @router.put("/{card_id}", response_model=FlashcardResponse)
-async def update_flashcard(card_id: str, updated_data: FlashcardUpdate, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
-    q = select(Flashcard).where(Flashcard.id == card_id)
-    res = await db.execute(q)
-    card = res.scalars().first()
-    if not card or card.user_id != current_user.id:
+async def update_flashcard(card_id: UUID, updated_data: FlashcardUpdate, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    values = updated_data.model_dump(exclude_none=True)
+    if values:
+        # набор SET-колонок зависит от запроса, поэтому UPDATE собирается здесь
+        q = update(Flashcard).where(*_OWNED_CARD).values(**values).returning(Flashcard)
+        res = await db.execute(q, {"card_id": card_id, "owner_id": current_user.id})
+        card = res.scalar_one_or_none()
+    else:
+        card = await db.get(Flashcard, card_id)
+    if card is None or card.user_id != current_user.id:
         raise HTTPException(status_code=404, detail="Card not found")
-    if updated_data.question is not None:
-        card.question = updated_data.question
-    if updated_data.answer is not None:
-        card.answer = updated_data.answer
-    db.add(card)
     await db.commit()
-    await db.refresh(card)
     return card
@@ -1,10 +1,13 @@
-from datetime import datetime, timezone
-from typing import List
+import asyncio
+import hashlib
+from typing import BinaryIO, List
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, File, HTTPException, UploadFile
-from sqlalchemy import delete, select
+from sqlalchemy import bindparam, delete, func, insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
 from app.core.database import get_db
 from app.core.security import get_current_user
 from app.core.utils import generate_uuid
@@ -14,42 +17,74 @@ from app.schemas.group import FileUploadResponse, GroupResponse
 
 router = APIRouter()
 
+_SELECT_USER_GROUPS = (
+    select(
+        Group.id,
+        Group.filename,
+        Group.created_at,
+        func.count(Flashcard.id).label("flashcards_count"),
+    )
+    .outerjoin(Flashcard, Flashcard.group_id == Group.id)
+    .where(Group.user_id == bindparam("owner_id"))
+    .group_by(Group.id)
+)
+# карточки удаляет сама БД через ON DELETE CASCADE
+_DELETE_GROUP = (
+    delete(Group)
+    .where(Group.id == bindparam("group_id"), Group.user_id == bindparam("owner_id"))
+    .returning(Group.id)
+)
+
+def _process_upload(
+    fileobj: BinaryIO, filename: str
+) -> tuple[str, list[tuple[str, str]]]:
+    # Файл читается кусками, чтобы память на запрос не зависела от его размера;
+    # сюда же подключается разбор PDF. Функция синхронная и вызывается через
+    # to_thread, чтобы чтение и разбор не блокировали event loop
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: fileobj.read(settings.UPLOAD_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    cards = [(f"Вопрос {i+1} к {filename}", f"Ответ {i+1}") for i in range(3)]
+    return digest.hexdigest(), cards
+
 @router.get("/", response_model=List[GroupResponse])
 async def get_user_groups(current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
-    q = select(Group).where(Group.user_id == current_user.id)
-    result = await db.execute(q)
-    groups = result.scalars().all()
-    return groups
+    # количество карточек считаем одним запросом, без подгрузки flashcards по группам
+    result = await db.execute(_SELECT_USER_GROUPS, {"owner_id": current_user.id})
+    return [GroupResponse.model_construct(**row._mapping) for row in result]
 
 @router.post("/upload", response_model=FileUploadResponse)
 async def upload_file(file: UploadFile = File(...), current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    sha256, cards = await asyncio.to_thread(_process_upload, file.file, file.filename)
     group_id = generate_uuid()
-    new_group = Group(
+    await db.execute(insert(Group).values(
         id=group_id,
         filename=file.filename,
         user_id=current_user.id,
-        created_at=datetime.now(timezone.utc)
-    )
-    db.add(new_group)
-    for i in range(3):
-        db.add(Flashcard(
-            id=generate_uuid(),
-            question=f"Вопрос {i+1} к {file.filename}",
-            answer=f"Ответ {i+1}",
-            user_id=current_user.id,
-            group_id=group_id
-        ))
+    ))
+    # все карточки одним multi-VALUES INSERT
+    await db.execute(insert(Flashcard), [
+        {
+            "id": generate_uuid(),
+            "question": question,
+            "answer": answer,
+            "user_id": current_user.id,
+            "group_id": group_id,
+        }
+        for question, answer in cards
+    ])
     await db.commit()
-    return {"group_id": group_id, "filename": file.filename, "message": "File processed successfully"}
+    return {
+        "group_id": group_id,
+        "filename": file.filename,
+        "sha256": sha256,
+        "message": "File processed successfully",
+    }
 
 @router.delete("/{group_id}")
-async def delete_group(group_id: str, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
-    q = select(Group).where(Group.id == group_id)
-    res = await db.execute(q)
-    group = res.scalars().first()
-    if not group or group.user_id != current_user.id:
+async def delete_group(group_id: UUID, current_user=Depends(get_current_user), db: AsyncSession = Depends(get_db)):
+    res = await db.execute(_DELETE_GROUP, {"group_id": group_id, "owner_id": current_user.id})
+    if res.scalar() is None:
         raise HTTPException(status_code=404, detail="Group not found")
-    await db.execute(delete(Flashcard).where(Flashcard.group_id == group_id))
-    await db.execute(delete(Group).where(Group.id == group_id))
     await db.commit()
     return {"detail": "Group deleted"}
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from typing import Optional
+from uuid import UUID
 
 class FlashcardCreate(BaseModel):
     question: str
@@ -10,8 +11,10 @@ class FlashcardUpdate(BaseModel):
     answer: Optional[str] = None
 
 class FlashcardResponse(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
     question: str
     answer: str
-    user_id: str
-    group_id: str
+    user_id: UUID
+    group_id: UUID
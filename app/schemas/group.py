@@ -1,15 +1,19 @@
 from datetime import datetime
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class GroupResponse(BaseModel):
-    id: str
+    model_config = ConfigDict(from_attributes=True)
+
+    id: UUID
     filename: str
     created_at: datetime
     flashcards_count: int
 
 class FileUploadResponse(BaseModel):
-    group_id: str
+    group_id: UUID
     filename: str
+    sha256: str
     message: str
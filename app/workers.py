@@ -0,0 +1,11 @@
+import os
+
+from uvicorn_worker import UvicornWorker as BaseUvicornWorker
+
+
+class UvicornWorker(BaseUvicornWorker):
+    # worker_connections из gunicorn UvicornWorker не читает — лимит отдаём uvicorn
+    CONFIG_KWARGS = {
+        **BaseUvicornWorker.CONFIG_KWARGS,
+        "limit_concurrency": int(os.getenv("WORKER_CONNECTIONS", "1000")),
+    }
@@ -0,0 +1,54 @@
+import math
+import os
+
+# Продакшен-запуск: gunicorn -c gunicorn.conf.py app.main:app
+# UvicornWorker сам выбирает uvloop и httptools (они ставятся с uvicorn[standard])
+
+# Бюджет соединений с Postgres: каждый воркер держит свой пул, и
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) не должно превышать DB_MAX_CONNECTIONS
+# (по умолчанию 80 — запас под max_connections=100 у postgres:16 для alembic и psql).
+# Минимум на воркер — 2 соединения, поэтому воркеров не больше DB_MAX_CONNECTIONS // 2.
+# app.core.config не импортируется здесь намеренно: модуль, загруженный в мастере,
+# достался бы воркерам после fork с неверным WEB_CONCURRENCY.
+DB_MAX_CONNECTIONS = int(os.getenv("DB_MAX_CONNECTIONS", "80"))
+MIN_DB_CONNECTIONS_PER_WORKER = 2
+
+
+def _available_cpus() -> int:
+    # cpu_count() в контейнере возвращает ядра хоста — сначала смотрим лимит cgroup v2
+    try:
+        with open("/sys/fs/cgroup/cpu.max") as f:
+            quota, period = f.read().split()
+        if quota != "max":
+            return max(1, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return len(os.sched_getaffinity(0))
+
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(
+    os.getenv(
+        "WEB_CONCURRENCY",
+        min(
+            _available_cpus() * 2 + 1,
+            DB_MAX_CONNECTIONS // MIN_DB_CONNECTIONS_PER_WORKER,
+        ),
+    )
+)
+worker_class = "app.workers.UvicornWorker"
+
+
+def on_starting(server):
+    # Итоговое число воркеров (с учётом -w/--workers из командной строки) известно
+    # только здесь; воркеры форкаются позже и делят пул по WEB_CONCURRENCY.
+    # Приложение не должно загружаться в мастере (preload_app), иначе настройки
+    # пула будут посчитаны до этого хука.
+    effective = server.cfg.workers
+    if effective * MIN_DB_CONNECTIONS_PER_WORKER > DB_MAX_CONNECTIONS:
+        raise RuntimeError(
+            f"{effective} workers need at least "
+            f"{effective * MIN_DB_CONNECTIONS_PER_WORKER} DB connections, "
+            f"but DB_MAX_CONNECTIONS is {DB_MAX_CONNECTIONS}"
+        )
+    os.environ["WEB_CONCURRENCY"] = str(effective)